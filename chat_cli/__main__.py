@@ -1,5 +1,6 @@
 import argparse
 from logging import basicConfig, getLogger
+from pathlib import Path
 
 import openai
 from dotenv import load_dotenv
@@ -10,6 +11,7 @@ from rich import print as rprint
 from rich.console import Console
 from rich.logging import RichHandler
 
+from chat_cli.utils.archive import ArchiveError
 from chat_cli.utils.manager import ChatSessionManager
 
 load_dotenv()
@@ -41,7 +43,9 @@ def main():
     session_manager = ChatSessionManager()
     session_manager.new_session()
 
-    command_completer = WordCompleter(["?", "n", "l", "s", "d", "q", "t", "tl", "m"])
+    command_completer = WordCompleter(
+        ["?", "n", "l", "s", "d", "q", "t", "tl", "m", "e", "i"]
+    )
 
     try:
         while True:
@@ -61,6 +65,8 @@ def main():
                     rprint("t - Toggle tools")
                     rprint("tl - List loaded tools")
                     rprint("m - Change model")
+                    rprint("e - Export conversation")
+                    rprint("i - Import conversation (messages only)")
                     rprint("q - Quit")
                 case "n":
                     session_id = session_manager.new_session()
@@ -140,6 +146,36 @@ def main():
                         session_manager.change_model(result)
                         rprint(f"Switched to model: {result}")
 
+                case "e":
+                    result = multi_line_prompt("Enter the path to export to: ")
+                    if result and Path(result).exists():
+                        answer = multi_line_prompt(
+                            f"{result} exists. Overwrite? (y/N): "
+                        )
+                        if answer.strip().lower() != "y":
+                            rprint("Export cancelled.")
+                            result = ""
+                    if result:
+                        try:
+                            count = session_manager.export_session(Path(result))
+                        except OSError as e:
+                            rprint(f"[red]Export failed: {e}[/red]")
+                        else:
+                            if count is None:
+                                rprint("No active session.")
+                            else:
+                                rprint(f"[green]Exported {count} messages[/green]")
+
+                case "i":
+                    result = multi_line_prompt("Enter the path to import from: ")
+                    if result:
+                        try:
+                            session_id = session_manager.import_session(Path(result))
+                        except (OSError, ArchiveError) as e:
+                            rprint(f"[red]Import failed: {e}[/red]")
+                        else:
+                            rprint(f"Imported session: {session_id}")
+
                 case _:
                     if user_input.strip() == "":
                         rprint("[red]Empty input is not allowed.[/red]")
@@ -30,13 +30,9 @@ class RequestsTool(BaseTool):
     description = "Send web requests and process the response."
     schema = RequestsToolSchema
 
-    def run(self, **kwargs) -> dict:
-        url = kwargs.get("url")
-        method = kwargs.get("method", "GET")
-        headers = kwargs.get("headers", {})
-        data = kwargs.get("data", {})
-        raw_response = kwargs.get("raw_response", False)
-
+    def run(
+        self, url: str, method: str, headers: dict, data: dict, raw_response: bool
+    ) -> dict:
         if not url:
             return {"error": "No URL provided."}
 
@@ -55,8 +51,10 @@ class RequestsTool(BaseTool):
         else:
             return self._process_response(response)
 
-    async def arun(self, **kwargs) -> dict:
-        return self.run(**kwargs)
+    async def arun(
+        self, url: str, method: str, headers: dict, data: dict, raw_response: bool
+    ) -> dict:
+        return self.run(url, method, headers, data, raw_response)
 
     def _process_response(self, response) -> dict:
         content_type = response.headers.get("Content-Type", "").lower()
@@ -13,8 +13,7 @@ class SearchTool(BaseTool):
     description = "Search the web for information."
     schema = SearchToolSchema
 
-    def run(self, **kwargs) -> dict:
-        query = kwargs.get("query")
+    def run(self, query: str) -> dict:
         if not query:
             return {"error": "No query provided."}
 
@@ -22,8 +21,7 @@ class SearchTool(BaseTool):
             results = ddgs.text(query)
             return results[0]
 
-    async def arun(self, **kwargs) -> dict:
-        query = kwargs.get("query")
+    async def arun(self, query: str) -> dict:
         if not query:
             return {"error": "No query provided."}
 
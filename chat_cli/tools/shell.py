@@ -13,7 +13,10 @@ class ShellCommandSchema(BaseModel):
         ..., title="Command", description="The shell command to execute."
     )
     confirmation: bool = Field(
-        ..., title="Confirmation", description="User confirmation to execute command."
+        ...,
+        strict=True,
+        title="Confirmation",
+        description="User confirmation to execute command.",
     )
 
 
@@ -22,13 +25,12 @@ class ShellCommandTool(BaseTool):
     description = "Execute shell commands with confirmation using Rich prompt. \nYou should take user's confirmation before executing the command."
     schema = ShellCommandSchema
 
-    def run(self, **kwargs) -> dict:
+    def run(self, command: str, confirmation: bool) -> dict:
         try:
-            command = kwargs.get("command")
             if not command:
                 return {"error": "No command provided."}
 
-            if not kwargs.get("confirmation"):
+            if not confirmation:
                 return {
                     "error": "You need to take user's confirmation to execute command."
                 }
@@ -59,5 +61,5 @@ class ShellCommandTool(BaseTool):
                 "returncode": 1,
             }
 
-    async def arun(self, **kwargs) -> dict:
-        return self.run(**kwargs)
+    async def arun(self, command: str, confirmation: bool) -> dict:
+        return self.run(command, confirmation)
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, List, Sequence, cast, overload
+
+if TYPE_CHECKING:
+    from openai.types.chat import ChatCompletionMessageParam
+
+# Archive layout:
+#   header  : MAGIC | version (u16)
+#   records : length (u32) | zlib-compressed JSON message, one per message
+#   index   : offset (u64) of each record
+#   footer  : record count (u32) | index offset (u64) | MAGIC
+MAGIC = b"CCA1"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sH")
+_LENGTH = struct.Struct("<I")
+_OFFSET = struct.Struct("<Q")
+_FOOTER = struct.Struct("<IQ4s")
+
+
+class ArchiveError(Exception):
+    pass
+
+
+def write_archive(path: Path, messages: Sequence[ChatCompletionMessageParam]) -> int:
+    """
+    Write the messages to a compressed archive file.
+
+    The archive is written to a temporary file next to `path` and moved into
+    place once complete, so a failed write never leaves a truncated archive.
+
+    Args:
+    path (Path): The path of the archive to write.
+    messages (Sequence[ChatCompletionMessageParam]): The messages to archive.
+
+    Returns:
+    int: The number of messages written.
+    """
+    path = Path(path)
+    offsets: List[int] = []
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION))
+            for message in messages:
+                record = zlib.compress(
+                    json.dumps(message, separators=(",", ":")).encode("utf-8")
+                )
+                offsets.append(f.tell())
+                f.write(_LENGTH.pack(len(record)))
+                f.write(record)
+
+            index_offset = f.tell()
+            for offset in offsets:
+                f.write(_OFFSET.pack(offset))
+            f.write(_FOOTER.pack(len(offsets), index_offset, MAGIC))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    return len(offsets)
+
+
+class MessageArchive:
+    """
+    Read-only view of an archive written by `write_archive`.
+
+    The file is memory-mapped and messages are decompressed on access,
+    so only the records that are actually read are decoded.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:
+            # mmap refuses empty files
+            self._file.close()
+            raise ArchiveError(f"Invalid archive: {self.path}") from e
+
+        try:
+            self._count, self._index_offset = self._read_layout()
+        except ArchiveError:
+            self.close()
+            raise
+
+    def _read_layout(self) -> tuple[int, int]:
+        size = len(self._mmap)
+        if size < _HEADER.size + _FOOTER.size:
+            raise ArchiveError(f"Invalid archive: {self.path}")
+
+        magic, version = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ArchiveError(f"Invalid archive: {self.path}")
+        if version != VERSION:
+            raise ArchiveError(f"Unsupported archive version: {version}")
+
+        count, index_offset, magic = _FOOTER.unpack_from(
+            self._mmap, size - _FOOTER.size
+        )
+        if magic != MAGIC or index_offset + count * _OFFSET.size != size - _FOOTER.size:
+            raise ArchiveError(f"Corrupted archive: {self.path}")
+        return count, index_offset
+
+    def _read(self, i: int) -> ChatCompletionMessageParam:
+        (offset,) = _OFFSET.unpack_from(
+            self._mmap, self._index_offset + i * _OFFSET.size
+        )
+        if not _HEADER.size <= offset <= self._index_offset - _LENGTH.size:
+            raise ArchiveError(f"Corrupted record {i} in archive: {self.path}")
+
+        (length,) = _LENGTH.unpack_from(self._mmap, offset)
+        start = offset + _LENGTH.size
+        if start + length > self._index_offset:
+            raise ArchiveError(f"Corrupted record {i} in archive: {self.path}")
+
+        try:
+            message = json.loads(zlib.decompress(self._mmap[start : start + length]))
+        except (struct.error, zlib.error, ValueError) as e:
+            raise ArchiveError(f"Corrupted record {i} in archive: {self.path}") from e
+
+        if not isinstance(message, dict) or "role" not in message:
+            raise ArchiveError(f"Record {i} is not a message in archive: {self.path}")
+        return cast("ChatCompletionMessageParam", message)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, key: int) -> ChatCompletionMessageParam: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> List[ChatCompletionMessageParam]: ...
+
+    def __getitem__(self, key: int | slice) -> Any:
+        if isinstance(key, slice):
+            return [self._read(i) for i in range(*key.indices(self._count))]
+        if key < 0:
+            key += self._count
+        if not 0 <= key < self._count:
+            raise IndexError("archive index out of range")
+        return self._read(key)
+
+    def __iter__(self) -> Iterator[ChatCompletionMessageParam]:
+        for i in range(self._count):
+            yield self._read(i)
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "MessageArchive":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import json
+import time
 from datetime import datetime
+from logging import getLogger
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
@@ -9,16 +11,20 @@ from uuid import uuid4
 import openai
 from openai.types.chat import ChatCompletionMessageParam
 from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
+from pydantic import ValidationError
 from rich import print as rprint
 from rich.console import Console
 from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 
+from .archive import MessageArchive, write_archive
 from .tool_loader import load_tools, to_openai_format
 
 PKG_PATH = Path(__file__).parent.parent
 
+logger = getLogger(__name__)
+
 
 class ChatSession:
     def __init__(
@@ -48,6 +54,20 @@ class ChatSession:
         chat_session.add_message(message)
         return chat_session
 
+    @classmethod
+    def from_archive(cls, path: Path) -> "ChatSession":
+        # The completions API needs the whole history, so every record is decoded
+        # here; use MessageArchive directly to inspect an archive lazily.
+        with MessageArchive(path) as archive:
+            messages = list(archive)
+        chat_session = cls()
+        # an empty archive must not pick up the default system prompt
+        chat_session.messages = messages
+        return chat_session
+
+    def export_messages(self, path: Path) -> int:
+        return write_archive(path, self.messages)
+
     def add_message(self, message: ChatCompletionMessageParam) -> None:
         self.messages.append(message)
 
@@ -153,6 +173,22 @@ class ChatSession:
             self.tool_fail_count += 1
             return None
 
+        start = time.perf_counter()
+        try:
+            args = tool.validate_args(args)
+        except ValidationError as e:
+            self.tool_fail_count += 1
+            return {
+                "error": f"Invalid arguments for {tool_name}.",
+                "details": json.loads(e.json(include_url=False)),
+            }
+        finally:
+            logger.debug(
+                "Validated %s args in %.3fms",
+                tool_name,
+                (time.perf_counter() - start) * 1000,
+            )
+
         result = tool.run(**args)
         if result.get("error"):
             self.tool_fail_count += 1
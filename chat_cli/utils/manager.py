@@ -1,3 +1,4 @@
+from pathlib import Path
 from uuid import uuid4
 
 from chat_cli.utils.chat import ChatSession
@@ -14,6 +15,17 @@ class ChatSessionManager:
         self.current_session = session_id
         return session_id
 
+    def import_session(self, path: Path) -> str:
+        session_id = str(uuid4())
+        self.sessions[session_id] = ChatSession.from_archive(path)
+        self.current_session = session_id
+        return session_id
+
+    def export_session(self, path: Path) -> int | None:
+        current_session = self.get_current_session()
+        if current_session:
+            return current_session.export_messages(path)
+
     def get_current_session(self) -> ChatSession | None:
         if self.current_session:
             return self.sessions[self.current_session]
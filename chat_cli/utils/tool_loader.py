@@ -19,6 +19,21 @@ class BaseTool(ABC):
     description: str
     schema: Type[BaseModel]
 
+    def validate_args(self, args: dict[str, Any]) -> dict[str, Any]:
+        """
+        Validate the arguments against the tool schema and fill in defaults.
+
+        Args:
+        args (dict[str, Any]): The raw arguments produced by the model.
+
+        Returns:
+        dict[str, Any]: The validated arguments.
+
+        Raises:
+        pydantic.ValidationError: If the arguments do not match the schema.
+        """
+        return self.schema.model_validate(args).model_dump()
+
     @abstractmethod
     def run(self, *args, **kwargs) -> Any:
         pass
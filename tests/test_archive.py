@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING, Any, List, cast
+
+import pytest
+
+from chat_cli.utils.archive import _FOOTER, ArchiveError, MessageArchive, write_archive
+
+if TYPE_CHECKING:
+    from openai.types.chat import ChatCompletionMessageParam
+
+MESSAGES: List[ChatCompletionMessageParam] = [
+    {"role": "system", "content": "You are a chat AI assistant."},
+    {"role": "user", "content": "Hello"},
+    {"role": "assistant", "content": "Hi! How can I help?"},
+    {"role": "user", "content": "こんにちは" * 100},
+]
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    path = tmp_path / "chat.cca"
+    write_archive(path, MESSAGES)
+    return path
+
+
+def test_round_trip(archive_path):
+    with MessageArchive(archive_path) as archive:
+        assert len(archive) == len(MESSAGES)
+        assert list(archive) == MESSAGES
+
+
+def test_indexing(archive_path):
+    with MessageArchive(archive_path) as archive:
+        assert archive[0] == MESSAGES[0]
+        assert archive[-1] == MESSAGES[-1]
+        assert archive[1:3] == MESSAGES[1:3]
+        assert archive[::-2] == MESSAGES[::-2]
+        with pytest.raises(IndexError):
+            archive[len(MESSAGES)]
+
+
+def test_empty_archive(tmp_path):
+    path = tmp_path / "empty.cca"
+    assert write_archive(path, []) == 0
+    with MessageArchive(path) as archive:
+        assert len(archive) == 0
+        assert list(archive) == []
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty"
+    path.write_bytes(b"")
+    with pytest.raises(ArchiveError):
+        MessageArchive(path)
+
+
+def test_truncated_file(archive_path):
+    archive_path.write_bytes(archive_path.read_bytes()[:-4])
+    with pytest.raises(ArchiveError):
+        MessageArchive(archive_path)
+
+
+def test_bad_magic(archive_path):
+    archive_path.write_bytes(b"XXXX" + archive_path.read_bytes()[4:])
+    with pytest.raises(ArchiveError):
+        MessageArchive(archive_path)
+
+
+def _index_offset(data: bytes | bytearray) -> int:
+    _, index_offset, _ = _FOOTER.unpack_from(data, len(data) - _FOOTER.size)
+    return index_offset
+
+
+def test_corrupted_index(archive_path):
+    data = bytearray(archive_path.read_bytes())
+    struct.pack_into("<Q", data, _index_offset(data), len(data) + 100)
+    archive_path.write_bytes(data)
+    with MessageArchive(archive_path) as archive:
+        with pytest.raises(ArchiveError):
+            archive[0]
+        assert archive[1] == MESSAGES[1]
+
+
+def test_corrupted_length(archive_path):
+    data = bytearray(archive_path.read_bytes())
+    (offset,) = struct.unpack_from("<Q", data, _index_offset(data))
+    struct.pack_into("<I", data, offset, 0xFFFFFFFF)
+    archive_path.write_bytes(data)
+    with MessageArchive(archive_path) as archive:
+        with pytest.raises(ArchiveError):
+            archive[0]
+
+
+def test_corrupted_record(archive_path):
+    data = bytearray(archive_path.read_bytes())
+    (offset,) = struct.unpack_from("<Q", data, _index_offset(data))
+    data[offset + 4 : offset + 8] = b"\x00" * 4
+    archive_path.write_bytes(data)
+    with MessageArchive(archive_path) as archive:
+        with pytest.raises(ArchiveError):
+            archive[0]
+
+
+def test_non_message_records(tmp_path):
+    path = tmp_path / "bad.cca"
+    write_archive(path, cast(Any, ["notadict", 1, {"content": "no role"}]))
+    with MessageArchive(path) as archive:
+        for i in range(len(archive)):
+            with pytest.raises(ArchiveError):
+                archive[i]
+
+
+def test_write_replaces_existing_archive(archive_path):
+    write_archive(archive_path, MESSAGES[:1])
+    with MessageArchive(archive_path) as archive:
+        assert list(archive) == MESSAGES[:1]
+    assert [p.name for p in archive_path.parent.iterdir()] == [archive_path.name]
+
+
+def test_failed_write_keeps_existing_archive(archive_path):
+    with pytest.raises(TypeError):
+        write_archive(archive_path, cast(Any, [{"role": "user", "content": object()}]))
+    with MessageArchive(archive_path) as archive:
+        assert list(archive) == MESSAGES
+    assert [p.name for p in archive_path.parent.iterdir()] == [archive_path.name]
@@ -0,0 +1,109 @@
+import logging
+import os
+
+import pytest
+
+from chat_cli.tools.request import RequestsTool
+from chat_cli.tools.search import SearchTool
+from chat_cli.tools.shell import ShellCommandTool
+from chat_cli.utils.chat import ChatSession
+
+VALID_ARGS = [
+    (RequestsTool, {"url": "https://example.com"}),
+    (SearchTool, {"query": "python"}),
+    (ShellCommandTool, {"command": "ls", "confirmation": True}),
+]
+
+
+@pytest.fixture
+def session():
+    return ChatSession()
+
+
+def _use_tool(session, monkeypatch, tool):
+    calls = []
+
+    def run(**kwargs):
+        calls.append(kwargs)
+        return {"ok": True}
+
+    monkeypatch.setattr(tool, "run", run)
+    session.tools = [tool]
+    return calls
+
+
+@pytest.mark.parametrize(
+    "tool, args",
+    [
+        (ShellCommandTool(), {"command": "ls"}),
+        (RequestsTool(), {"method": "POST"}),
+    ],
+)
+def test_missing_required_field(session, monkeypatch, tool, args):
+    calls = _use_tool(session, monkeypatch, tool)
+
+    result = session.execute_tool(tool.name, args)
+
+    assert result["error"]
+    assert result["details"][0]["type"] == "missing"
+    assert calls == []
+    assert session.tool_fail_count == 1
+
+
+def test_non_dict_args(session, monkeypatch):
+    tool = ShellCommandTool()
+    calls = _use_tool(session, monkeypatch, tool)
+
+    result = session.execute_tool(tool.name, ["ls", True])
+
+    assert result["error"]
+    assert result["details"]
+    assert calls == []
+
+
+def test_defaults_applied(session, monkeypatch):
+    tool = RequestsTool()
+    calls = _use_tool(session, monkeypatch, tool)
+
+    session.execute_tool(tool.name, {"url": "https://example.com"})
+
+    assert calls == [
+        {
+            "url": "https://example.com",
+            "method": "GET",
+            "headers": {},
+            "data": {},
+            "raw_response": False,
+        }
+    ]
+
+
+@pytest.mark.parametrize("confirmation", ["yes", "true", 1])
+def test_confirmation_must_be_bool(session, monkeypatch, confirmation):
+    tool = ShellCommandTool()
+    calls = _use_tool(session, monkeypatch, tool)
+
+    result = session.execute_tool(
+        tool.name, {"command": "ls", "confirmation": confirmation}
+    )
+
+    assert result["error"]
+    assert calls == []
+
+
+@pytest.mark.skipif(
+    not os.environ.get("CHAT_CLI_BENCHMARK"),
+    reason="set CHAT_CLI_BENCHMARK=1 to run benchmarks",
+)
+@pytest.mark.parametrize("tool_cls, args", VALID_ARGS)
+def test_validation_overhead(session, monkeypatch, caplog, tool_cls, args):
+    tool = tool_cls()
+    _use_tool(session, monkeypatch, tool)
+    number = 1000
+
+    with caplog.at_level(logging.DEBUG, logger="chat_cli.utils.chat"):
+        for _ in range(number):
+            session.execute_tool(tool.name, args)
+
+    timings = [r for r in caplog.records if r.msg == "Validated %s args in %.3fms"]
+    assert len(timings) == number